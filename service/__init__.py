@@ -18,8 +18,8 @@
 Package: service
 
 Package for the application models and service routes
-This module creates and configures the Flask app and sets up the logging
-and SQL database
+This module creates the Flask app, and create_app() configures it and
+sets up the logging and SQL database
 """
 import sys
 from flask import Flask
@@ -41,18 +41,37 @@ app.config.from_object(config)
 from service import routes, models        # noqa: F401, E402
 from service.common import error_handlers, cli_commands  # noqa: F401, E402
 
-# Set up logging for production
-log_handlers.init_logging(app, "gunicorn.error")
 
-app.logger.info(70 * "*")
-app.logger.info("  P E T   S E R V I C E   R U N N I N G  ".center(70, "*"))
-app.logger.info(70 * "*")
+def create_app(config_object=config) -> Flask:
+    """Configures the app, sets up logging and the database and returns the app
 
-try:
-    models.init_db(app)  # make our sqlalchemy tables
-except Exception as error:  # pylint: disable=broad-except
-    app.logger.critical("%s: Cannot continue", error)
-    # gunicorn requires exit code 4 to stop spawning workers when they die
-    sys.exit(4)
+    This is not a true factory: the routes are registered on the module-level
+    app, so this initializes and returns that same app every time. Call it
+    once per process, e.g. from the gunicorn or FLASK_APP entry point or the
+    session fixture in the tests.
 
-app.logger.info("Service initialized!")
+    :param config_object: the configuration to load
+    :type config_object: module or class
+
+    :return: the initialized Flask app
+    :rtype: Flask
+
+    """
+    app.config.from_object(config_object)
+
+    # Set up logging for production
+    log_handlers.init_logging(app, "gunicorn.error")
+
+    app.logger.info(70 * "*")
+    app.logger.info("  P E T   S E R V I C E   R U N N I N G  ".center(70, "*"))
+    app.logger.info(70 * "*")
+
+    try:
+        models.init_db(app)  # make our sqlalchemy tables
+    except Exception as error:  # pylint: disable=broad-except
+        app.logger.critical("%s: Cannot continue", error)
+        # gunicorn requires exit code 4 to stop spawning workers when they die
+        sys.exit(4)
+
+    app.logger.info("Service initialized!")
+    return app
@@ -0,0 +1,43 @@
+"""
+Pytest configuration for the test suite
+
+The Flask app is created once per test session and shared by every test
+file. When the tests are run with pytest-xdist each worker creates its own
+app against its own database.
+"""
+import os
+import logging
+import pytest
+from sqlalchemy.engine import make_url
+from service import create_app
+from service.models import db
+from tests.database import tune_sqlite, worker_database_uri
+
+
+# pylint: disable=too-few-public-methods
+class TestingConfig:
+    """Configuration for the test session"""
+
+    TESTING = True
+    DEBUG = False
+    # Give each pytest-xdist worker its own database
+    SQLALCHEMY_DATABASE_URI = worker_database_uri(
+        os.getenv("DATABASE_URI", "sqlite:///:memory:")
+    )
+    # The tests only ever use one connection at a time, so on Postgres keep
+    # a single pooled connection instead of growing the pool to five.
+    # In-memory SQLite already gets a StaticPool from Flask-SQLAlchemy
+    if make_url(SQLALCHEMY_DATABASE_URI).get_backend_name() == "postgresql":
+        SQLALCHEMY_ENGINE_OPTIONS = {"pool_size": 1, "max_overflow": 0}
+
+
+@pytest.fixture(scope="session")
+def app():
+    """Creates the Flask app and its tables once for the whole test session"""
+    # init_db only creates tables that are missing and the tables are never
+    # dropped, so they are always reused (the route tests empty them)
+    flask_app = create_app(TestingConfig)
+    flask_app.logger.setLevel(logging.CRITICAL)
+    with flask_app.app_context():
+        tune_sqlite(db)
+        yield flask_app
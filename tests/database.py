@@ -0,0 +1,128 @@
+"""
+Test Database Utilities
+
+Helpers shared by the test cases to manage the test database. The tests
+default to an in-memory SQLite database; set DATABASE_URI to run them
+against Postgres instead. When the tests are run in parallel with
+pytest-xdist each worker gets its own database so that workers never see
+each other's data.
+"""
+import os
+import tempfile
+from functools import lru_cache
+from filelock import FileLock
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import make_url
+
+# Lock file used to serialize database creation across xdist workers
+DB_INIT_LOCK = os.path.join(tempfile.gettempdir(), "db_init.lock")
+
+# Settings that keep SQLite from touching the disk during the tests
+SQLITE_PRAGMAS = [
+    "synchronous=OFF",
+    "journal_mode=MEMORY",
+    "locking_mode=EXCLUSIVE",
+    "temp_store=MEMORY",
+]
+
+
+@lru_cache(maxsize=None)
+def worker_database_uri(database_uri: str) -> str:
+    """Returns the database uri to use for the current pytest-xdist worker
+
+    Outside of xdist the uri is returned unchanged. Under xdist the worker
+    id (gw0, gw1, ...) is appended to the database name and the database is
+    created the first time a worker asks for it.
+
+    :param database_uri: the uri of the shared test database
+    :type database_uri: str
+
+    :return: the uri of the database for this worker
+    :rtype: str
+
+    """
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    if not worker:
+        return database_uri
+
+    url = make_url(database_uri)
+    if not url.database or url.database == ":memory:":
+        return database_uri  # in-memory databases are already per process
+
+    if url.get_backend_name() == "sqlite":
+        root, ext = os.path.splitext(url.database)
+        return url.set(database=f"{root}_{worker}{ext}").render_as_string(hide_password=False)
+
+    worker_url = url.set(database=f"{url.database}_{worker}")
+    with FileLock(DB_INIT_LOCK):
+        _create_database(database_uri, worker_url.database)
+    return worker_url.render_as_string(hide_password=False)
+
+
+def _create_database(database_uri: str, name: str):
+    """Creates the database called name on the server of database_uri"""
+    engine = create_engine(database_uri, isolation_level="AUTOCOMMIT")
+    try:
+        with engine.connect() as conn:
+            found = conn.execute(
+                text("SELECT 1 FROM pg_database WHERE datname = :name"), {"name": name}
+            ).scalar()
+            if not found:
+                conn.execute(text(f'CREATE DATABASE "{name}"'))
+    finally:
+        engine.dispose()
+
+
+def empty_table(db, table: str):
+    """Removes all of the rows from table
+
+    :param db: the SQLAlchemy object the service uses
+    :type db: SQLAlchemy
+    :param table: the name of the table to empty
+    :type table: str
+
+    """
+    if db.engine.dialect.name == "postgresql":
+        statement = f"TRUNCATE {table} RESTART IDENTITY"
+    else:
+        statement = f"DELETE FROM {table}"
+    with db.engine.begin() as conn:
+        conn.exec_driver_sql(statement)
+
+
+def tune_sqlite(db):
+    """Prepares an SQLite test database for speed and for SAVEPOINTs
+
+    Turns off durability since test data is thrown away anyway, and stops
+    pysqlite from managing transactions itself so that the SAVEPOINTs the
+    tests roll back to work. Does nothing when the tests are run against
+    another database, or when the engine has already been prepared.
+
+    :param db: the SQLAlchemy object the service uses
+    :type db: SQLAlchemy
+
+    """
+    engine = db.engine
+    if engine.dialect.name != "sqlite" or event.contains(engine, "connect", _on_sqlite_connect):
+        return
+    event.listen(engine, "connect", _on_sqlite_connect)
+    event.listen(engine, "begin", _on_sqlite_begin)
+    # reconnect so the listeners see every connection, an in-memory
+    # database goes away with its connection so the tables are recreated
+    db.session.remove()
+    engine.dispose()
+    db.create_all()
+
+
+def _on_sqlite_connect(dbapi_connection, _connection_record):
+    """Configures each new SQLite connection"""
+    dbapi_connection.isolation_level = None  # SQLAlchemy will emit BEGIN
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(f"PRAGMA {pragma}")
+    cursor.close()
+
+
+def _on_sqlite_begin(conn):
+    """Starts the transaction that pysqlite no longer starts for us"""
+    conn.exec_driver_sql("BEGIN")
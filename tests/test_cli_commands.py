@@ -5,9 +5,11 @@ import os
 from unittest import TestCase
 from unittest.mock import patch, MagicMock
 from click.testing import CliRunner
+import pytest
 from service.common.cli_commands import db_create
 
 
+@pytest.mark.usefixtures("app")
 class TestFlaskCLI(TestCase):
     """Test Flask CLI Commands"""
 
@@ -18,6 +20,6 @@ class TestFlaskCLI(TestCase):
     def test_db_create(self, db_mock):
         """It should call the db-create command"""
         db_mock.return_value = MagicMock()
-        with patch.dict(os.environ, {"FLASK_APP": "service:app"}, clear=True):
+        with patch.dict(os.environ, {"FLASK_APP": "service:create_app()"}, clear=True):
             result = self.runner.invoke(db_create)
             self.assertEqual(result.exit_code, 0)